@@ -208,7 +208,11 @@ class Context:
         """Optional[:class:`fortnitepy.ClientParty`]: The party this message
         was sent from. ``None`` if the message was not sent from a party.
         """
-        return getattr(self.message, 'party', None)
+        message = self.message
+        kind = getattr(message, '_kind', None)
+        if kind is None:
+            return getattr(message, 'party', None)
+        return message.party if kind == 'party' else None
 
     @property
     def author(self) -> Union[Friend, PartyMember]:
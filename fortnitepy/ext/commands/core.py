@@ -426,18 +426,14 @@ class Command(_BaseCommand):
         if converter is bool:
             return _convert_to_bool(argument)
 
-        try:
-            module = converter.__module__
-        except AttributeError:
-            pass
-        else:
-            if module is not None and (module.startswith('fortnitepy.')
-                                       and not module.endswith('converter')):
-                converter = getattr(
-                    converters,
-                    converter.__name__ + 'Converter',
-                    converter
-                )
+        module = getattr(converter, '__module__', None)
+        if module is not None and (module.startswith('fortnitepy.')
+                                   and not module.endswith('converter')):
+            converter = getattr(
+                converters,
+                converter.__name__ + 'Converter',
+                converter
+            )
 
         try:
             if inspect.isclass(converter):
@@ -465,11 +461,7 @@ class Command(_BaseCommand):
         except errors.CommandError:
             raise
         except Exception as exc:
-            try:
-                name = converter.__name__
-            except AttributeError:
-                name = converter.__class__.__name__
-
+            name = errors._converter_name(converter)
             raise errors.BadArgument('Converting to "{}" failed for parameter '
                                      '"{}".'.format(name, param.name)) from exc
 
@@ -477,39 +469,35 @@ class Command(_BaseCommand):
                             converter: Converter,
                             argument: str,
                             param: inspect.Parameter) -> Any:
-        try:
-            origin = converter.__origin__
-        except AttributeError:
-            pass
-        else:
-            if origin is Union:
-                errors = []
-                NoneType = type(None)
-                for conv in converter.__args__:
-                    if conv is NoneType and param.kind != param.VAR_POSITIONAL:
-                        ctx.view.undo()
-                        if param.default is param.empty:
-                            return None
-                        else:
-                            return param.default
-
-                    try:
-                        value = await self._actual_conversion(
-                            ctx,
-                            conv,
-                            argument,
-                            param
-                        )
-                    except errors.CommandError as exc:
-                        errors.append(exc)
+        origin = getattr(converter, '__origin__', None)
+        if origin is Union:
+            errs = []
+            NoneType = type(None)
+            for conv in converter.__args__:
+                if conv is NoneType and param.kind != param.VAR_POSITIONAL:
+                    ctx.view.undo()
+                    if param.default is param.empty:
+                        return None
                     else:
-                        return value
+                        return param.default
 
-                raise errors.BadUnionArgument(
-                    param,
-                    converter.__args__,
-                    errors
-                )
+                try:
+                    value = await self._actual_conversion(
+                        ctx,
+                        conv,
+                        argument,
+                        param
+                    )
+                except errors.CommandError as exc:
+                    errs.append(exc)
+                else:
+                    return value
+
+            raise errors.BadUnionArgument(
+                param,
+                converter.__args__,
+                errs
+            )
 
         return await self._actual_conversion(ctx, converter, argument, param)
 
@@ -577,15 +565,19 @@ class Command(_BaseCommand):
             previous = view.index
 
             view.skip_ws()
+            code, argument = view.parse_quoted_word()
+            if code != errors.PARSE_OK:
+                view.index = previous
+                break
+
             try:
-                argument = view.get_quoted_word()
                 value = await self.do_conversion(
                     ctx,
                     converter,
                     argument,
                     param
                 )
-            except (errors.CommandError, errors.ArgumentParsingError):
+            except errors.CommandError:
                 view.index = previous
                 break
             else:
@@ -600,10 +592,14 @@ class Command(_BaseCommand):
                                         converter: Converter) -> Any:
         view = ctx.view
         previous = view.index
+        code, argument = view.parse_quoted_word()
+        if code != errors.PARSE_OK:
+            view.index = previous
+            raise RuntimeError()
+
         try:
-            argument = view.get_quoted_word()
             value = await self.do_conversion(ctx, converter, argument, param)
-        except (errors.CommandError, errors.ArgumentParsingError):
+        except errors.CommandError:
             view.index = previous
             raise RuntimeError() from None
         else:
@@ -1004,11 +1000,7 @@ class Command(_BaseCommand):
         return ''
 
     def _is_typing_optional(self, annotation: Any) -> bool:
-        try:
-            origin = annotation.__origin__
-        except AttributeError:
-            return False
-
+        origin = getattr(annotation, '__origin__', None)
         if origin is not Union:
             return False
 
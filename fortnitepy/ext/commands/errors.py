@@ -23,6 +23,8 @@ DEALINGS IN THE SOFTWARE.
 """
 
 
+import sys
+
 from inspect import Parameter
 from typing import TYPE_CHECKING, Optional, List, Tuple
 from fortnitepy.errors import FortniteException
@@ -62,6 +64,33 @@ __all__ = (
     'ExtensionNotFound',
 )
 
+# Result codes used internally by the argument parser. A failed parse only
+# becomes one of the ArgumentParsingError subclasses below once it reaches
+# a caller that actually needs to raise it.
+PARSE_OK = 0
+PARSE_UNEXPECTED_QUOTE = 1
+PARSE_INVALID_END_OF_QUOTED_STRING = 2
+PARSE_EXPECTED_CLOSING_QUOTE = 3
+
+# Static default messages, interned once at import so every instance shares
+# the same string object.
+_CHECK_ANY_FAILURE_MESSAGE = sys.intern(
+    'You do not have permission to run this command.'
+)
+_PRIVATE_MESSAGE_ONLY_MESSAGE = sys.intern(
+    'This command can only be used in private messages.'
+)
+_PARTY_MESSAGE_ONLY_MESSAGE = sys.intern(
+    'This command can only be used in party messages.'
+)
+
+# map from bucket type names to the MaxConcurrencyReached message suffix
+_concurrency_suffixes = {}
+
+
+def _converter_name(x: 'Converter') -> str:
+    return getattr(x, '__name__', None) or type(x).__name__
+
 
 class CommandError(FortniteException):
     r"""The base exception type for all command related errors.
@@ -73,11 +102,31 @@ class CommandError(FortniteException):
     from :class:`.Bot`\, :func:`event_command_error`.
     """
 
-    def __init__(self, message: Optional[str] = None, *args: list) -> None:
+    def __init__(self, message: Optional[str] = None) -> None:
         if message is not None:
-            super().__init__(message, *args)
+            super().__init__(message)
         else:
-            super().__init__(*args)
+            super().__init__()
+
+    @property
+    def args(self) -> tuple:
+        args = BaseException.args.__get__(self)
+        if not args:
+            # Subclasses that format their message lazily in __str__ store
+            # it in args the first time args is requested.
+            message = str(self)
+            if message:
+                args = (message,)
+                BaseException.args.__set__(self, args)
+        return args
+
+    @args.setter
+    def args(self, value: tuple) -> None:
+        BaseException.args.__set__(self, value)
+
+    def __repr__(self) -> str:
+        self.args  # makes sure a lazily formatted message is included
+        return super().__repr__()
 
 
 class UserInputError(CommandError):
@@ -115,8 +164,10 @@ class MissingRequiredArgument(UserInputError):
 
     def __init__(self, param: Parameter) -> None:
         self.param = param
-        super().__init__('{0.name} is a required argument that is '
-                         'missing.'.format(param))
+        super().__init__()
+
+    def __str__(self) -> str:
+        return f'{self.param.name} is a required argument that is missing.'
 
 
 class TooManyArguments(UserInputError):
@@ -162,7 +213,7 @@ class CheckAnyFailure(CheckFailure):
                  errors: List[CheckFailure]) -> None:
         self.checks = checks
         self.errors = errors
-        super().__init__('You do not have permission to run this command.')
+        super().__init__(_CHECK_ANY_FAILURE_MESSAGE)
 
 
 class PrivateMessageOnly(CheckFailure):
@@ -173,9 +224,7 @@ class PrivateMessageOnly(CheckFailure):
     """
 
     def __init__(self, message: Optional[str] = None) -> None:
-        super().__init__(
-            message or 'This command can only be used in private messages.'
-        )
+        super().__init__(message or _PRIVATE_MESSAGE_ONLY_MESSAGE)
 
 
 class PartyMessageOnly(CheckFailure):
@@ -185,9 +234,7 @@ class PartyMessageOnly(CheckFailure):
     This inherits from :exc:`CheckFailure`
     """
     def __init__(self, message: Optional[str] = None) -> None:
-        super().__init__(
-            message or 'This command can only be used in party messages.'
-        )
+        super().__init__(message or _PARTY_MESSAGE_ONLY_MESSAGE)
 
 
 class NotOwner(CheckFailure):
@@ -211,6 +258,16 @@ class CommandInvokeError(CommandError):
 
     This inherits from :exc:`CommandError`
 
+    Parameters
+    ----------
+    e: :exc:`Exception`
+        The exception raised by the command.
+    keep_traceback: :class:`bool`
+        Whether the traceback of ``e`` should be kept. By default it is
+        removed so that the frames it references, and their local variables,
+        are not kept alive for as long as this error is. Pass ``True`` to keep
+        it, e.g. for post-mortem debugging. Defaults to ``False``.
+
     Attributes
     ----------
     original
@@ -218,10 +275,18 @@ class CommandInvokeError(CommandError):
         the ``__cause__`` attribute.
     """
 
-    def __init__(self, e: Exception) -> None:
+    def __init__(self, e: Exception, *,
+                 keep_traceback: bool = False) -> None:
+        if not keep_traceback:
+            e = e.with_traceback(None)
+
         self.original = e
-        super().__init__('Command raised an exception: '
-                         '{0.__class__.__name__}: {0}'.format(e))
+        super().__init__()
+
+    def __str__(self) -> str:
+        e = self.original
+        cls_name = type(e).__name__
+        return f'Command raised an exception: {cls_name}: {e}'
 
 
 class CommandOnCooldown(CommandError):
@@ -241,8 +306,10 @@ class CommandOnCooldown(CommandError):
     def __init__(self, cooldown: 'Cooldown', retry_after: float) -> None:
         self.cooldown = cooldown
         self.retry_after = retry_after
-        super().__init__('You are on cooldown. Try again in '
-                         '{:.2f}s'.format(retry_after))
+        super().__init__()
+
+    def __str__(self) -> str:
+        return f'You are on cooldown. Try again in {self.retry_after:.2f}s'
 
 
 class MaxConcurrencyReached(CommandError):
@@ -262,12 +329,19 @@ class MaxConcurrencyReached(CommandError):
     def __init__(self, number: int, per: 'BucketType') -> None:
         self.number = number
         self.per = per
-        name = per.name
-        suffix = 'per %s' % name if per.name != 'default' else 'globally'
-        plural = '%s times %s' if number > 1 else '%s time %s'
-        fmt = plural % (number, suffix)
-        super().__init__('Too many people using this command. It can only '
-                         'be used {} concurrently.'.format(fmt))
+        super().__init__()
+
+    def __str__(self) -> str:
+        number = self.number
+        name = self.per.name
+        suffix = _concurrency_suffixes.get(name)
+        if suffix is None:
+            suffix = 'globally' if name == 'default' else f'per {name}'
+            _concurrency_suffixes[name] = suffix
+
+        unit = 'times' if number > 1 else 'time'
+        return ('Too many people using this command. It can only '
+                f'be used {number} {unit} {suffix} concurrently.')
 
 
 class ConversionError(CommandError):
@@ -311,21 +385,24 @@ class BadUnionArgument(UserInputError):
         self.param = param
         self.converters = converters
         self.errors = errors
-
-        def _get_name(x):
-            try:
-                return x.__name__
-            except AttributeError:
-                return x.__class__.__name__
-
-        to_string = [_get_name(x) for x in converters]
-        if len(to_string) > 2:
-            fmt = '{}, or {}'.format(', '.join(to_string[:-1]), to_string[-1])
+        super().__init__()
+
+    def __str__(self) -> str:
+        converters = self.converters
+        n = len(converters)
+        if n == 1:
+            fmt = _converter_name(converters[0])
+        elif n == 2:
+            fmt = (f'{_converter_name(converters[0])} or '
+                   f'{_converter_name(converters[1])}')
+        elif n > 2:
+            to_string = [_converter_name(x) for x in converters]
+            last = to_string.pop()
+            fmt = f"{', '.join(to_string)}, or {last}"
         else:
-            fmt = ' or '.join(to_string)
+            fmt = ''
 
-        super().__init__('Could not convert "{0.name}" into '
-                         '{1}.'.format(param, fmt))
+        return f'Could not convert "{self.param.name}" into {fmt}.'
 
 
 class ArgumentParsingError(UserInputError):
@@ -353,8 +430,11 @@ class UnexpectedQuoteError(ArgumentParsingError):
 
     def __init__(self, quote: str) -> None:
         self.quote = quote
-        super().__init__('Unexpected quote mark, {0!r}, in non-quoted '
-                         'string'.format(quote))
+        super().__init__()
+
+    def __str__(self) -> str:
+        return (f'Unexpected quote mark, {self.quote!r}, in non-quoted '
+                'string')
 
 
 class InvalidEndOfQuotedStringError(ArgumentParsingError):
@@ -371,8 +451,11 @@ class InvalidEndOfQuotedStringError(ArgumentParsingError):
 
     def __init__(self, char: str) -> None:
         self.char = char
-        super().__init__('Expected space after closing quotation but '
-                         'received {0!r}'.format(char))
+        super().__init__()
+
+    def __str__(self) -> str:
+        return ('Expected space after closing quotation but '
+                f'received {self.char!r}')
 
 
 class ExpectedClosingQuoteError(ArgumentParsingError):
@@ -388,7 +471,10 @@ class ExpectedClosingQuoteError(ArgumentParsingError):
 
     def __init__(self, close_quote: str) -> None:
         self.close_quote = close_quote
-        super().__init__('Expected closing {}.'.format(close_quote))
+        super().__init__()
+
+    def __str__(self) -> str:
+        return f'Expected closing {self.close_quote}.'
 
 
 # Extension
@@ -404,12 +490,10 @@ class ExtensionError(FortniteException):
         The extension that had an error.
     """
 
-    def __init__(self, message: Optional[str] = None,
-                 *args: list,
+    def __init__(self, message: Optional[str] = None, *,
                  name: str) -> None:
         self.name = name
-        message = message or 'Extension {!r} had an error.'.format(name)
-        super().__init__(message, *args)
+        super().__init__(message or f'Extension {name!r} had an error.')
 
 
 class ExtensionAlreadyLoaded(ExtensionError):
@@ -419,8 +503,8 @@ class ExtensionAlreadyLoaded(ExtensionError):
     """
 
     def __init__(self, name: str) -> None:
-        super().__init__('Extension {!r} is already loaded.'
-                         ''.format(name), name=name)
+        super().__init__(f'Extension {name!r} is already loaded.',
+                         name=name)
 
 
 class ExtensionNotLoaded(ExtensionError):
@@ -430,8 +514,8 @@ class ExtensionNotLoaded(ExtensionError):
     """
 
     def __init__(self, name: str) -> None:
-        super().__init__('Extension {!r} has not been loaded.'
-                         ''.format(name), name=name)
+        super().__init__(f'Extension {name!r} has not been loaded.',
+                         name=name)
 
 
 class ExtensionMissingEntryPoint(ExtensionError):
@@ -442,8 +526,8 @@ class ExtensionMissingEntryPoint(ExtensionError):
     """
 
     def __init__(self, name: str) -> None:
-        super().__init__("Extension {!r} has no 'setup' function."
-                         "".format(name), name=name)
+        super().__init__(f"Extension {name!r} has no 'setup' function.",
+                         name=name)
 
 
 class ExtensionFailed(ExtensionError):
@@ -452,6 +536,16 @@ class ExtensionFailed(ExtensionError):
 
     This inherits from :exc:`ExtensionError`
 
+    Parameters
+    ----------
+    name: :class:`str`
+        The extension that had the error.
+    original: :exc:`Exception`
+        The exception raised while loading the extension.
+    keep_traceback: :class:`bool`
+        Whether the traceback of ``original`` should be kept. Works the same
+        way as in :exc:`CommandInvokeError`. Defaults to ``False``.
+
     Attributes
     -----------
     name: :class:`str`
@@ -461,10 +555,15 @@ class ExtensionFailed(ExtensionError):
         the ``__cause__`` attribute.
     """
 
-    def __init__(self, name: str, original: Exception) -> None:
+    def __init__(self, name: str, original: Exception, *,
+                 keep_traceback: bool = False) -> None:
+        if not keep_traceback:
+            original = original.with_traceback(None)
+
         self.original = original
-        fmt = 'Extension {0!r} raised an error: {1.__class__.__name__}: {1}'
-        super().__init__(fmt.format(name, original), name=name)
+        cls_name = type(original).__name__
+        super().__init__(f'Extension {name!r} raised an error: '
+                         f'{cls_name}: {original}', name=name)
 
 
 class ExtensionNotFound(ExtensionError):
@@ -479,5 +578,5 @@ class ExtensionNotFound(ExtensionError):
     """
 
     def __init__(self, name: str) -> None:
-        fmt = 'Extension {0!r} could not be loaded.'
-        super().__init__(fmt.format(name), name=name)
+        super().__init__(f'Extension {name!r} could not be loaded.',
+                         name=name)
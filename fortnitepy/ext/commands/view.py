@@ -23,10 +23,13 @@ DEALINGS IN THE SOFTWARE.
 """
 
 
-from typing import Optional
+from typing import Optional, Tuple
 
 from .errors import (UnexpectedQuoteError, InvalidEndOfQuotedStringError,
-                     ExpectedClosingQuoteError)
+                     ExpectedClosingQuoteError, PARSE_OK,
+                     PARSE_UNEXPECTED_QUOTE,
+                     PARSE_INVALID_END_OF_QUOTED_STRING,
+                     PARSE_EXPECTED_CLOSING_QUOTE)
 
 # map from opening quotes to closing quotes
 _quotes = {
@@ -50,6 +53,13 @@ _quotes = {
 }
 _all_quotes = set(_quotes.keys()) | set(_quotes.values())
 
+# map from parse result codes to the exception they represent
+_parse_errors = {
+    PARSE_UNEXPECTED_QUOTE: UnexpectedQuoteError,
+    PARSE_INVALID_END_OF_QUOTED_STRING: InvalidEndOfQuotedStringError,
+    PARSE_EXPECTED_CLOSING_QUOTE: ExpectedClosingQuoteError,
+}
+
 
 class StringView:
     def __init__(self, buffer: str) -> None:
@@ -130,9 +140,17 @@ class StringView:
         return result
 
     def get_quoted_word(self) -> Optional[str]:
+        code, value = self.parse_quoted_word()
+        if code != PARSE_OK:
+            raise _parse_errors[code](value)
+        return value
+
+    def parse_quoted_word(self) -> Tuple[int, Optional[str]]:
+        # Returns a (code, value) pair. On success code is PARSE_OK and value
+        # is the word read, otherwise value is the offending quote or char.
         current = self.current
         if current is None:
-            return None
+            return PARSE_OK, None
 
         close_quote = _quotes.get(current)
         is_quoted = bool(close_quote)
@@ -148,8 +166,8 @@ class StringView:
             if not current:
                 if is_quoted:
                     # unexpected EOF
-                    raise ExpectedClosingQuoteError(close_quote)
-                return ''.join(result)
+                    return PARSE_EXPECTED_CLOSING_QUOTE, close_quote
+                return PARSE_OK, ''.join(result)
 
             # currently we accept strings in the format of "hello world"
             # to embed a quote inside the string you must escape it:
@@ -160,9 +178,9 @@ class StringView:
                     # string ends with \ and no character after it
                     if is_quoted:
                         # if we're quoted then we're expecting a closing quote
-                        raise ExpectedClosingQuoteError(close_quote)
+                        return PARSE_EXPECTED_CLOSING_QUOTE, close_quote
                     # if we aren't then we just let it through
-                    return ''.join(result)
+                    return PARSE_OK, ''.join(result)
 
                 if next_char in _escaped_quotes:
                     # escaped quote
@@ -175,24 +193,26 @@ class StringView:
 
             if not is_quoted and current in _all_quotes:
                 # we aren't quoted
-                raise UnexpectedQuoteError(current)
+                return PARSE_UNEXPECTED_QUOTE, current
 
             # closing quote
             if is_quoted and current == close_quote:
                 next_char = self.get()
                 valid_eof = not next_char or next_char.isspace()
                 if not valid_eof:
-                    raise InvalidEndOfQuotedStringError(next_char)
+                    return PARSE_INVALID_END_OF_QUOTED_STRING, next_char
 
                 # we're quoted so it's okay
-                return ''.join(result)
+                return PARSE_OK, ''.join(result)
 
             if current.isspace() and not is_quoted:
                 # end of word found
-                return ''.join(result)
+                return PARSE_OK, ''.join(result)
 
             result.append(current)
 
+        return PARSE_OK, None
+
     def __repr__(self) -> str:
         return ('<StringView pos: {0.index} prev: {0.previous} end: {0.end} '
                 'eof: {0.eof}>'.format(self))
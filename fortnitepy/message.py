@@ -25,6 +25,7 @@ SOFTWARE.
 """
 
 import datetime
+import time
 
 from typing import TYPE_CHECKING, Union
 
@@ -36,7 +37,12 @@ if TYPE_CHECKING:
 
 class MessageBase:
 
-    __slots__ = ('_client', '_author', '_content', '_created_at')
+    __slots__ = ('_client', '_author', '_content', '_created_at_ts',
+                 '_created_at_dt')
+
+    # Internal tag checked by ext.commands instead of isinstance(). Not part
+    # of the public API.
+    _kind = None
 
     def __init__(self, client: 'Client',
                  author: Union['Friend', 'PartyMember'],
@@ -44,7 +50,8 @@ class MessageBase:
         self._client = client
         self._author = author
         self._content = content
-        self._created_at = datetime.datetime.utcnow()
+        self._created_at_ts = time.time()
+        self._created_at_dt = None
 
     @property
     def client(self) -> 'Client':
@@ -52,8 +59,11 @@ class MessageBase:
         return self._client
 
     @property
-    def author(self) -> 'Friend':
-        """:class:`Friend`: The author of the message."""
+    def author(self) -> Union['Friend', 'PartyMember']:
+        """Union[:class:`Friend`, :class:`PartyMember`]: The author of the
+        message. This is a :class:`Friend` for friend messages and a
+        :class:`PartyMember` for party messages.
+        """
         return self._author
 
     @property
@@ -66,17 +76,30 @@ class MessageBase:
         """:class:`datetime.datetime`: The time of when this message was
         received in UTC.
         """
-        return self._created_at
+        if self._created_at_dt is None:
+            self._created_at_dt = datetime.datetime.utcfromtimestamp(
+                self._created_at_ts
+            )
+        return self._created_at_dt
 
 
 class FriendMessage(MessageBase):
 
-    __slots__ = MessageBase.__slots__
+    __slots__ = ()
+
+    _kind = 'friend'
+
+    author: 'Friend'
 
     def __init__(self, client: 'Client',
                  author: 'Friend',
                  content: str) -> None:
-        super().__init__(client, author, content)
+        # MessageBase.__init__ is inlined to avoid the super() call.
+        self._client = client
+        self._author = author
+        self._content = content
+        self._created_at_ts = time.time()
+        self._created_at_dt = None
 
     def __repr__(self) -> str:
         return ('<FriendMessage author={0.author!r} '
@@ -97,24 +120,28 @@ class FriendMessage(MessageBase):
 
 class PartyMessage(MessageBase):
 
-    __slots__ = MessageBase.__slots__ + ('party',)
+    __slots__ = ('party',)
+
+    _kind = 'party'
+
+    author: 'PartyMember'
 
     def __init__(self, client: 'Client',
                  party: 'ClientParty',
                  author: 'PartyMember',
                  content: str) -> None:
-        super().__init__(client, author, content)
+        # MessageBase.__init__ is inlined to avoid the super() call.
+        self._client = client
+        self._author = author
+        self._content = content
+        self._created_at_ts = time.time()
+        self._created_at_dt = None
         self.party = party
 
     def __repr__(self) -> str:
         return ('<PartyMessage party={0.party!r} author={0.author!r} '
                 'created_at={0.created_at!r}>'.format(self))
 
-    @property
-    def author(self) -> 'PartyMember':
-        """:class:`PartyMember`: The author of a message."""
-        return self._author
-
     async def reply(self, content: str) -> None:
         """|coro|
 
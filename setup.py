@@ -37,13 +37,12 @@ setuptools.setup(
     install_requires=requirements,
     extras_require=extras_require,
     packages=['fortnitepy', 'fortnitepy.ext.commands'],
-    python_requires='>=3.5.3',
+    python_requires='>=3.6',
     classifiers=[
           'License :: OSI Approved :: MIT License',
           'Intended Audience :: Developers',
           'Natural Language :: English',
           'Operating System :: OS Independent',
-          'Programming Language :: Python :: 3.5',
           'Programming Language :: Python :: 3.6',
           'Programming Language :: Python :: 3.7',
           'Programming Language :: Python :: 3.8',